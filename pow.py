@@ -8,67 +8,125 @@ try:
     import curses
     import os
     import re
+    import string
+    from array import array
     from datetime import datetime
+    from itertools import zip_longest
     from pathlib import Path
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process
 except ImportError as e:
     print(f"Error: Missing dependency - {e}")
     print("Install with: pip install rapidfuzz")
     exit(1)
 
 # Text file extensions to automatically include
-TEXT_EXTENSIONS = {
+TEXT_EXTENSIONS = frozenset({
     '.txt', '.md', '.py', '.js', '.json', '.yaml', '.yml',
     '.html', '.css', '.sh', '.conf', '.cfg', '.ini', '.log',
     '.sql', '.xml', '.csv', '.toml', '.rs', '.go', '.c', '.cpp',
     '.h', '.hpp', '.java', '.php', '.rb', '.pl', '.ts', '.jsx',
     '.tsx', '.vue', '.svelte', '.scss', '.sass', '.less'
-}
+})
+
+# Same extensions without the leading dot, matched against name.rpartition('.')
+_TEXT_SUFFIXES = frozenset(ext[1:] for ext in TEXT_EXTENSIONS)
+
+# Printable ASCII plus tab, newline and carriage return; deleted with
+# bytes.translate to count printable bytes without a Python-level loop
+_PRINTABLE_BYTES = bytes([9, 10, 13]) + bytes(range(32, 127))
+
+# Tree prefixes for file list rows
+_PREFIX_MID = "├── "
+_PREFIX_END = "└── "
+
+# Filename sanitizing: ASCII characters outside [A-Za-z0-9_-] are deleted
+# with str.translate (non-ASCII is stripped beforehand by encoding)
+_ALLOWED_CHARS = set(string.ascii_letters + string.digits + '-_')
+_SANITIZE_TABLE = str.maketrans('', '', ''.join(chr(i) for i in range(128) if chr(i) not in _ALLOWED_CHARS))
+_MULTIHYPHEN_RE = re.compile(r'-+')
 
 class FileExplorer:
     def __init__(self):
         self.current_path = Path.cwd()
         self.cursor_position = 0
-        self.items = []
+        # Directory listing kept as parallel columns, one entry per item
+        self._names = []
+        self._is_dir = array('b')
+        self._paths = []
+        # 1 = shown as text, 0 = extensionless file not sniffed yet
+        self._text_status = bytearray()
+        # DirEntry kept for unsniffed files so the empty-file check stays cheap
+        self._dir_entries = []
+        self._names_lower = ()
         self.search_mode = False
         self.search_query = ""
-        self.filtered_items = []
+        # Indices into the columns above, best search match first
+        self.filtered_indices = []
         self.note_mode = False
         self.note_title = ""
+        # Rows painted in the previous frame, diffed against in render_ui
+        self._last_lines = []
+        self._last_size = None
+        # (current_path, width, header) reused across frames
+        self._cached_header = None
+        # Set by handle_input on every key; main loop only renders when set
+        self._dirty = True
+        # Daily note filename, reformatted only when the date changes
+        self._cached_ordinal = None
+        self._cached_daily = None
         
-    def is_text_file(self, path):
+    def is_text_file(self, path, dir_entry=None):
         """Check if file is text based on extension or content"""
-        if path.suffix.lower() in TEXT_EXTENSIONS:
+        if self._ext_is_text(path.name):
             return True
         
         # For files without extension, check content
-        if not path.suffix:
-            try:
-                with open(path, 'rb') as f:
-                    chunk = f.read(512)
-                    # Handle empty files
-                    if not chunk:
-                        return True  # Treat empty files as text files
-                    try:
-                        chunk.decode('utf-8')
-                        # Check if mostly printable characters
-                        printable_ratio = sum(c < 127 and (c >= 32 or c in [9, 10, 13]) for c in chunk) / len(chunk)
-                        return printable_ratio > 0.8
-                    except UnicodeDecodeError:
-                        return False
-            except (PermissionError, OSError):
-                return False
+        if self._is_extensionless(path.name):
+            return self._content_is_text(path, dir_entry)
         
         return False
     
+    def _is_extensionless(self, name):
+        """Check if file name has no suffix, by the same rule as Path.suffix"""
+        # A leading dot or a trailing dot doesn't start a suffix
+        i = name.rfind('.')
+        return not 0 < i < len(name) - 1
+    
+    def _ext_is_text(self, name):
+        """Check if file name has a known text extension"""
+        stem, _, ext = name.rpartition('.')
+        return bool(stem) and ext.lower() in _TEXT_SUFFIXES
+    
+    def _content_is_text(self, path, dir_entry=None):
+        """Check if file content looks like text by sniffing the first 512 bytes"""
+        try:
+            # DirEntry caches its stat result, so empty files need no open()
+            if dir_entry is not None and dir_entry.stat().st_size == 0:
+                return True  # Treat empty files as text files
+            with open(path, 'rb') as f:
+                chunk = f.read(512)
+                # Handle empty files
+                if not chunk:
+                    return True  # Treat empty files as text files
+                try:
+                    chunk.decode('utf-8')
+                    # Check if mostly printable characters
+                    nonprintable = len(chunk.translate(None, _PRINTABLE_BYTES))
+                    printable_ratio = (len(chunk) - nonprintable) / len(chunk)
+                    return printable_ratio > 0.8
+                except UnicodeDecodeError:
+                    return False
+        except (PermissionError, OSError):
+            return False
+    
     def sanitize_filename(self, title):
         """Sanitize title for use as filename"""
         # Replace spaces with hyphens
         filename = title.replace(' ', '-')
         # Remove or replace special characters, keep only alphanumeric, hyphens, and underscores
-        filename = re.sub(r'[^a-zA-Z0-9\-_]', '', filename)
+        filename = filename.encode('ascii', 'ignore').decode('ascii').translate(_SANITIZE_TABLE)
         # Remove consecutive hyphens
-        filename = re.sub(r'-+', '-', filename)
+        filename = _MULTIHYPHEN_RE.sub('-', filename)
         # Remove leading/trailing hyphens
         filename = filename.strip('-')
         # Ensure it's not empty
@@ -78,7 +136,12 @@ class FileExplorer:
     
     def get_daily_note_filename(self):
         """Generate today's daily note filename in ISO format"""
-        return datetime.now().strftime("%Y-%m-%d.md")
+        now = datetime.now()
+        today = now.toordinal()
+        if today != self._cached_ordinal:
+            self._cached_daily = now.strftime("%Y-%m-%d.md")
+            self._cached_ordinal = today
+        return self._cached_daily
     
     def create_note(self, title):
         """Create a new markdown note with the given title"""
@@ -86,14 +149,26 @@ class FileExplorer:
             return False
             
         filename = self.sanitize_filename(title.strip())
-        file_path = self.current_path / f"{filename}.md"
         
-        # Check if file already exists
+        try:
+            # Check if file already exists with a single directory listing;
+            # compared lowercased so case-insensitive filesystems are safe
+            prefix = filename.lower()
+            existing = {
+                name for name in map(str.lower, os.listdir(self.current_path))
+                if name.startswith(prefix) and name.endswith('.md')
+            }
+            taken = lambda note_name: note_name.lower() in existing
+        except OSError:
+            # Writable but unreadable directory: probe each name instead
+            taken = lambda note_name: (self.current_path / note_name).exists()
+        
+        note_name = f"{filename}.md"
         counter = 1
-        original_path = file_path
-        while file_path.exists():
-            file_path = self.current_path / f"{filename}-{counter}.md"
+        while taken(note_name):
+            note_name = f"{filename}-{counter}.md"
             counter += 1
+        file_path = self.current_path / note_name
         
         try:
             # Create empty markdown file
@@ -122,55 +197,111 @@ class FileExplorer:
     
     def scan_directory(self):
         """Scan current directory for text files and subdirectories"""
-        self.items = []
-        
-        # Add parent directory if not at root
-        if self.current_path != self.current_path.parent:
-            self.items.append(("../", True, self.current_path.parent))
+        self._names = []
+        self._is_dir = array('b')
+        self._paths = []
+        self._text_status = bytearray()
+        self._dir_entries = []
+        self._names_lower = ()
         
+        entries = []
         try:
-            entries = []
-            for item in self.current_path.iterdir():
-                # Skip hidden files
-                if item.name.startswith('.'):
-                    continue
-                
-                try:
-                    if item.is_dir():
-                        entries.append((f"{item.name}/", True, item))
-                    elif item.is_file() and self.is_text_file(item):
-                        entries.append((item.name, False, item))
-                except (PermissionError, OSError):
-                    # Skip files we can't read
-                    continue
-            
-            # Sort: directories first, then files, both alphabetically
-            entries.sort(key=lambda x: (not x[1], x[0].lower()))
-            self.items.extend(entries)
+            # DirEntry caches the file type from readdir, so is_dir/is_file
+            # don't cost an extra stat() per entry like Path.iterdir does
+            with os.scandir(self.current_path) as it:
+                for entry in it:
+                    # Skip hidden files (readdir never yields an empty name)
+                    if entry.name[0] == '.':
+                        continue
+                    
+                    try:
+                        if entry.is_dir():
+                            entries.append((f"{entry.name}/", True, Path(entry.path), 1, None))
+                        elif entry.is_file():
+                            # Extension lookup first; extensionless files are
+                            # listed provisionally and sniffed once visible
+                            name = entry.name
+                            if self._ext_is_text(name):
+                                entries.append((name, False, Path(entry.path), 1, None))
+                            elif self._is_extensionless(name):
+                                entries.append((name, False, Path(entry.path), 0, entry))
+                    except (PermissionError, OSError):
+                        # Skip files we can't read
+                        continue
             
         except PermissionError:
             # Will be shown in render_ui
             pass
+        
+        # Sort: directories first, then files, both alphabetically
+        entries.sort(key=lambda x: (not x[1], x[0].lower()))
+        
+        # Add parent directory if not at root, compared as plain strings
+        current = os.fspath(self.current_path)
+        parent = os.path.dirname(current)
+        if parent != current:
+            entries.insert(0, ("../", True, Path(parent), 1, None))
+        
+        for name, is_dir, path, text_status, dir_entry in entries:
+            self._names.append(name)
+            self._is_dir.append(is_dir)
+            self._paths.append(path)
+            self._text_status.append(text_status)
+            self._dir_entries.append(dir_entry)
+        
+        # Lowercased names for fuzzy search; rebuilt whenever items change
+        self._names_lower = tuple(name.lower() for name in self._names)
             
         # Reset cursor if out of bounds
-        if self.items:
-            self.cursor_position = min(self.cursor_position, len(self.items) - 1)
+        if self._names:
+            self.cursor_position = min(self.cursor_position, len(self._names) - 1)
             self.cursor_position = max(0, self.cursor_position)
         else:
             self.cursor_position = 0
     
     def render_ui(self, stdscr):
-        """Render the current UI state"""
-        stdscr.clear()
+        """Render the current UI state, repainting only rows that changed"""
         height, width = stdscr.getmaxyx()
         
+        # A resized terminal gets a full repaint
+        if (height, width) != self._last_size:
+            self._last_size = (height, width)
+            self._last_lines = []
+        
+        self.resolve_visible(self._available_rows(height))
+        lines = self._compose_lines(height, width)
+        
+        # Nothing changed since the last frame
+        if lines == self._last_lines:
+            return
+        
+        if not self._last_lines:
+            stdscr.clear()
+        
+        for i, (old, new) in enumerate(zip_longest(self._last_lines, lines)):
+            if old != new:
+                stdscr.move(i, 0)
+                stdscr.clrtoeol()
+                if new:
+                    stdscr.addstr(i, 0, new)
+        
+        self._last_lines = lines
+        stdscr.refresh()
+    
+    def _compose_lines(self, height, width):
+        """Build the frame as one string per screen row, without touching curses"""
+        lines = [""] * height
         row = 0
         
-        # Header - current path
-        path_str = str(self.current_path)
-        if len(path_str) > width - 1:
-            path_str = "..." + path_str[-(width-4):]
-        stdscr.addstr(row, 0, path_str)
+        # Header - current path, only reformatted when path or width change
+        if self._cached_header and self._cached_header[:2] == (self.current_path, width):
+            path_str = self._cached_header[2]
+        else:
+            path_str = str(self.current_path)
+            if len(path_str) > width - 1:
+                path_str = "..." + path_str[-(width-4):]
+            self._cached_header = (self.current_path, width, path_str)
+        lines[row] = path_str
         row += 1
         
         # Search bar if in search mode
@@ -178,97 +309,180 @@ class FileExplorer:
             search_str = f"Search: {self.search_query}"
             if len(search_str) < width - 1:
                 search_str += "▌"
-            stdscr.addstr(row, 0, search_str[:width-1])
+            lines[row] = search_str[:width-1]
             row += 1
-            display_items = self.filtered_items
         elif self.note_mode:
             note_str = f"New note title: {self.note_title}"
             if len(note_str) < width - 1:
                 note_str += "▌"
-            stdscr.addstr(row, 0, note_str[:width-1])
+            lines[row] = note_str[:width-1]
             row += 1
-            display_items = self.items
-        else:
-            display_items = self.items
+        
+        display_indices = self._visible_indices()
             
         row += 1  # Empty line
         
         # File list with cursor
-        if not display_items:
+        if not display_indices:
             if row < height - 1:
-                stdscr.addstr(row, 0, "No text files found")
+                lines[row] = "No text files found"
         else:
-            # Calculate how many items we can show
-            available_rows = height - row - 2  # Leave space for status line
-            start_idx = max(0, self.cursor_position - available_rows + 1)
-            end_idx = min(len(display_items), start_idx + available_rows)
+            start_idx, end_idx = self._list_window(
+                self._available_rows(height), len(display_indices))
             
-            # Adjust start if we're at the end
-            if end_idx == len(display_items):
-                start_idx = max(0, end_idx - available_rows)
+            # Room left for the name after the tree prefix; the cursor row
+            # also reserves space for the " ◀" indicator
+            max_w = max(0, width - 1)
+            name_w = max(0, max_w - len(_PREFIX_MID))
+            cursor_name_w = max(0, name_w - 3)
+            last = len(display_indices) - 1
             
             for i in range(start_idx, end_idx):
                 if row >= height - 2:  # Leave space for status
                     break
                     
-                name, is_dir, path = display_items[i]
+                name = self._names[display_indices[i]]
                 
                 # Tree characters
-                if i == len(display_items) - 1:
-                    prefix = "└── "
-                else:
-                    prefix = "├── "
+                prefix = _PREFIX_END if i == last else _PREFIX_MID
                     
-                # Build display line
-                display_line = prefix + name
-                
-                # Add cursor indicator
+                # Build display line, truncated by the format precision
                 if i == self.cursor_position:
-                    if len(display_line) < width - 3:
-                        display_line += " ◀"
-                    else:
-                        display_line = display_line[:width-4] + " ◀"
-                
-                # Truncate if too long
-                if len(display_line) > width - 1:
-                    display_line = display_line[:width-1]
+                    display_line = f"{prefix}{name:.{cursor_name_w}} ◀"
+                else:
+                    display_line = f"{prefix}{name:.{name_w}}"
                 
-                stdscr.addstr(row, 0, display_line)
+                # Narrow terminals can't fit the prefix and indicator either
+                lines[row] = display_line[:max_w]
                 row += 1
         
-        # Status line at bottom
+        # Status line at bottom; counts include extensionless files that
+        # haven't been on screen yet, so they may still drop as binaries
         if self.search_mode:
-            if display_items:
-                status = f"[{len(self.filtered_items)} of {len(self.items)} items] • ESC clear • Enter open"
+            if display_indices:
+                status = f"[{len(self.filtered_indices)} of {len(self._names)} items] • ESC clear • Enter open"
             else:
-                status = f"[0 of {len(self.items)} items] • ESC clear search"
+                status = f"[0 of {len(self._names)} items] • ESC clear search"
         elif self.note_mode:
             status = "Enter note title • ESC cancel • Enter create"
         else:
-            status = f"[{len(self.items)} items] • ↑↓ navigate • Enter open • q quit • / search • Ctrl+N/D new daily/note"
+            status = f"[{len(self._names)} items] • ↑↓ navigate • Enter open • q quit • / search • Ctrl+N/D new daily/note"
         
         # Show status at bottom
-        status_row = height - 1
         if len(status) > width - 1:
             status = status[:width-1]
-        stdscr.addstr(status_row, 0, status)
+        lines[height - 1] = status
         
-        stdscr.refresh()
+        return lines
+    
+    def _available_rows(self, height):
+        """Number of file list rows that fit between the header and status line"""
+        # Path header, optional search/note bar, empty line
+        top = 3 if (self.search_mode or self.note_mode) else 2
+        return height - top - 2  # Leave space for status line
+    
+    def _list_window(self, available_rows, count):
+        """Range of list positions shown for the current cursor position"""
+        start_idx = max(0, self.cursor_position - available_rows + 1)
+        end_idx = min(count, start_idx + available_rows)
+        
+        # Adjust start if we're at the end
+        if end_idx == count:
+            start_idx = max(0, end_idx - available_rows)
+        return start_idx, end_idx
+    
+    def resolve_visible(self, available_rows):
+        """Sniff unchecked files in the visible window, dropping binary ones"""
+        while True:
+            display_indices = self._visible_indices()
+            start_idx, end_idx = self._list_window(available_rows, len(display_indices))
+            binary = []
+            for i in range(start_idx, end_idx):
+                idx = display_indices[i]
+                if self._text_status[idx]:
+                    continue
+                if self.is_text_file(self._paths[idx], self._dir_entries[idx]):
+                    self._text_status[idx] = 1
+                    self._dir_entries[idx] = None
+                else:
+                    binary.append(i)
+            # Past the window, sniff until a text item follows so the last
+            # row drawn only gets the end-of-tree glyph if it really is last
+            if end_idx > start_idx:
+                for i in range(end_idx, len(display_indices)):
+                    idx = display_indices[i]
+                    if self._text_status[idx]:
+                        break
+                    if self.is_text_file(self._paths[idx], self._dir_entries[idx]):
+                        self._text_status[idx] = 1
+                        self._dir_entries[idx] = None
+                        break
+                    binary.append(i)
+            if not binary:
+                return
+            # Removing rows shifts the window, which may reveal new unchecked files
+            self._drop_items(display_indices, binary)
+    
+    def _drop_items(self, display_indices, positions):
+        """Remove items at the given list positions, keeping the cursor on its item"""
+        dropped = {display_indices[i] for i in positions}
+        self.cursor_position -= sum(1 for i in positions if i < self.cursor_position)
+        
+        keep = [idx for idx in range(len(self._names)) if idx not in dropped]
+        remap = {old: new for new, old in enumerate(keep)}
+        self._names = [self._names[idx] for idx in keep]
+        self._is_dir = array('b', (self._is_dir[idx] for idx in keep))
+        self._paths = [self._paths[idx] for idx in keep]
+        self._text_status = bytearray(self._text_status[idx] for idx in keep)
+        self._dir_entries = [self._dir_entries[idx] for idx in keep]
+        self._names_lower = tuple(self._names_lower[idx] for idx in keep)
+        
+        if isinstance(self.filtered_indices, range):
+            self.filtered_indices = range(len(self._names))
+        else:
+            self.filtered_indices = [remap[idx] for idx in self.filtered_indices if idx in remap]
+        
+        count = len(self._visible_indices())
+        self.cursor_position = max(0, min(self.cursor_position, count - 1))
+    
+    def _visible_indices(self):
+        """Indices of the items currently listed on screen"""
+        if self.search_mode:
+            return self.filtered_indices
+        return range(len(self._names))
+    
+    def open_item(self, idx):
+        """Enter a directory or open a file by item index"""
+        # Items opened before they were ever on screen haven't been sniffed
+        if not self._text_status[idx]:
+            if not self.is_text_file(self._paths[idx], self._dir_entries[idx]):
+                display_indices = self._visible_indices()
+                self._drop_items(display_indices, [display_indices.index(idx)])
+                return
+            self._text_status[idx] = 1
+            self._dir_entries[idx] = None
+        
+        if self._is_dir[idx]:
+            self.navigate_to(self._paths[idx])
+        else:
+            self.open_file(self._paths[idx])
     
     def handle_search(self, query):
         """Filter items using fuzzy search"""
         if not query:
-            self.filtered_items = self.items[:]
+            # Lazy range, no per-keystroke copy of the listing
+            self.filtered_indices = range(len(self._names))
         else:
-            matches = []
-            for item in self.items:
-                score = fuzz.ratio(query.lower(), item[0].lower())
-                if score > 40:  # Threshold for relevance
-                    matches.append((score, item))
-            
-            # Sort by score (best matches first)
-            matches.sort(key=lambda x: x[0], reverse=True)
-            self.filtered_items = [item for score, item in matches]
+            q = query.lower()
+            # Scored and sorted (best matches first) inside rapidfuzz
+            results = process.extract(
+                q, self._names_lower,
+                scorer=fuzz.ratio, processor=None,
+                score_cutoff=40,  # Threshold for relevance
+                limit=None,
+            )
+            # score_cutoff is inclusive; only scores above 40 count as relevant
+            self.filtered_indices = [idx for _, score, idx in results if score > 40]
         
         # Reset cursor position
         self.cursor_position = 0
@@ -277,6 +491,8 @@ class FileExplorer:
         """Open file in configured editor and exit"""
         # Restore terminal before launching editor
         curses.endwin()
+        # Screen contents are lost once curses is suspended
+        self._last_lines = []
         
         editor = os.getenv('EDITOR')
         if not editor:
@@ -298,6 +514,7 @@ class FileExplorer:
     
     def navigate_to(self, path):
         """Navigate to a new directory"""
+        self._cached_header = None
         try:
             self.current_path = path.resolve()
             self.cursor_position = 0
@@ -312,7 +529,9 @@ class FileExplorer:
     
     def handle_input(self, key):
         """Handle keyboard input"""
-        current_items = self.filtered_items if self.search_mode else self.items
+        # Any key (including KEY_RESIZE) may change what's on screen
+        self._dirty = True
+        current_indices = self._visible_indices()
         
         if self.search_mode:
             if key == 27:  # Escape
@@ -322,12 +541,8 @@ class FileExplorer:
             elif key in (127, curses.KEY_BACKSPACE, 8):  # Backspace
                 self.search_query = self.search_query[:-1]
                 self.handle_search(self.search_query)
-            elif key in (10, 13) and current_items:  # Enter
-                selected = current_items[self.cursor_position]
-                if selected[1]:  # Directory
-                    self.navigate_to(selected[2])
-                else:  # File
-                    self.open_file(selected[2])
+            elif key in (10, 13) and current_indices:  # Enter
+                self.open_item(current_indices[self.cursor_position])
             elif 32 <= key <= 126:  # Printable ASCII
                 self.search_query += chr(key)
                 self.handle_search(self.search_query)
@@ -357,44 +572,42 @@ class FileExplorer:
                 self.note_title = ""
             elif key == 4:  # Ctrl+D
                 self.open_daily_note()
-            elif key == curses.KEY_UP and current_items:
+            elif key == curses.KEY_UP and current_indices:
                 self.cursor_position = max(0, self.cursor_position - 1)
-            elif key == curses.KEY_DOWN and current_items:
-                self.cursor_position = min(len(current_items) - 1, self.cursor_position + 1)
-            elif key in (10, 13) and current_items:  # Enter
-                selected = current_items[self.cursor_position]
-                if selected[1]:  # Directory
-                    self.navigate_to(selected[2])
-                else:  # File
-                    self.open_file(selected[2])
+            elif key == curses.KEY_DOWN and current_indices:
+                self.cursor_position = min(len(current_indices) - 1, self.cursor_position + 1)
+            elif key in (10, 13) and current_indices:  # Enter
+                self.open_item(current_indices[self.cursor_position])
         
         return True  # Continue running
     
     def run(self):
         """Main application loop with curses"""
         self.scan_directory()
+        curses.wrapper(self.main_loop)
+    
+    def main_loop(self, stdscr):
+        """Read keys and redraw until the user quits"""
+        # Setup curses
+        curses.curs_set(0)  # Hide cursor
+        stdscr.timeout(1000)  # Wakes immediately on keypress
         
-        def main_loop(stdscr):
-            # Setup curses
-            curses.curs_set(0)  # Hide cursor
-            stdscr.timeout(100)  # Non-blocking input
-            
-            while True:
-                try:
+        while True:
+            try:
+                if self._dirty:
                     self.render_ui(stdscr)
+                    self._dirty = False
+                
+                # Get input
+                key = stdscr.getch()
+                if key == -1:  # No input (timeout)
+                    continue
                     
-                    # Get input
-                    key = stdscr.getch()
-                    if key == -1:  # No input (timeout)
-                        continue
-                        
-                    if not self.handle_input(key):
-                        break
-                        
-                except KeyboardInterrupt:
+                if not self.handle_input(key):
                     break
-        
-        curses.wrapper(main_loop)
+                    
+            except KeyboardInterrupt:
+                break
 
 def main():
     """Entry point"""
@@ -45,6 +45,12 @@ def test_text_file_detection():
         assert not explorer.is_text_file(binary_file), "Should not detect binary as text"
         assert explorer.is_text_file(empty_file), "Should detect empty file as text"
         
+        # Scanning hands over the DirEntry, whose cached stat spots empty files
+        with os.scandir(tmp_path) as it:
+            entries = {entry.name: entry for entry in it}
+        assert explorer.is_text_file(empty_file, entries["empty"]), "Should detect empty file from DirEntry"
+        assert not explorer.is_text_file(binary_file, entries["binary.bin"]), "Should not detect binary as text"
+        
     print("✓ Text file detection working")
 
 def test_filename_sanitization():
@@ -108,21 +114,37 @@ def test_directory_scanning():
         (tmp_path / "script.py").write_text("print('test')")
         (tmp_path / "binary.bin").write_bytes(b'\x00\x01')
         (tmp_path / ".hidden").write_text("hidden")
+        (tmp_path / "notes").write_text("plain text without extension")
+        (tmp_path / "blob").write_bytes(b'\x00\xff\x00\xff')
+        (tmp_path / "empty").write_text("")
+        (tmp_path / "README.").write_text("trailing dot")
         
         # Scan directory
         explorer.scan_directory()
         
+        # Extensionless files are listed until they are sniffed on screen
+        assert "blob" in explorer._names, "Extensionless files should be listed provisionally"
+        explorer.resolve_visible(len(explorer._names))
+        
         # Check items
-        item_names = [item[0] for item in explorer.items]
+        item_names = explorer._names
         
         # Should include text files and directories
         assert "test.txt" in item_names, "Should include text files"
         assert "script.py" in item_names, "Should include Python files"
         assert "subdir/" in item_names, "Should include subdirectories"
+        assert explorer._is_dir[item_names.index("subdir/")], "Subdirectories should be flagged as directories"
+        assert not explorer._is_dir[item_names.index("test.txt")], "Files should not be flagged as directories"
+        assert explorer._paths[item_names.index("test.txt")] == tmp_path / "test.txt", "Paths should line up with names"
+        assert "notes" in item_names, "Should include extensionless text files"
+        assert "empty" in item_names, "Should include empty extensionless files"
+        assert "README." in item_names, "Trailing-dot names should be treated as extensionless"
         
         # Should not include binary or hidden files
         assert "binary.bin" not in item_names, "Should not include binary files"
         assert ".hidden" not in item_names, "Should not include hidden files"
+        assert "blob" not in item_names, "Should not include extensionless binary files"
+        assert len(explorer._names_lower) == len(item_names), "Search cache should follow dropped items"
         
     print("✓ Directory scanning working")
 
@@ -132,25 +154,37 @@ def test_search_functionality():
     
     explorer = FileExplorer()
     
-    # Mock some items
-    explorer.items = [
-        ("readme.md", False, Path("readme.md")),
-        ("test.py", False, Path("test.py")),
-        ("main.js", False, Path("main.js")),
-        ("config.yaml", False, Path("config.yaml")),
-    ]
-    
-    # Test search
-    explorer.handle_search("test")
-    assert len(explorer.filtered_items) >= 1, "Should find matching items"
-    
-    # Test fuzzy matching
-    explorer.handle_search("tst")  # Fuzzy match for "test"
-    assert len(explorer.filtered_items) >= 1, "Should find fuzzy matches"
-    
-    # Test empty search
-    explorer.handle_search("")
-    assert len(explorer.filtered_items) == len(explorer.items), "Empty search should show all items"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        explorer.current_path = tmp_path
+        
+        # Create some items
+        for name in ("readme.md", "test.py", "main.js", "config.yaml"):
+            (tmp_path / name).write_text("")
+        explorer.scan_directory()
+        
+        # Test search
+        explorer.handle_search("test")
+        assert len(explorer.filtered_indices) >= 1, "Should find matching items"
+        assert explorer._names[explorer.filtered_indices[0]] == "test.py", "Best match should come first"
+        
+        # Test fuzzy matching
+        explorer.handle_search("tst")  # Fuzzy match for "test"
+        assert len(explorer.filtered_indices) >= 1, "Should find fuzzy matches"
+        
+        # Test case-insensitive matching
+        explorer.handle_search("README")
+        assert explorer._names[explorer.filtered_indices[0]] == "readme.md", "Search should ignore case"
+        
+        # Test relevance threshold: a score of exactly 40 is not a match
+        (tmp_path / "a.md").write_text("")
+        explorer.scan_directory()
+        explorer.handle_search("a")
+        assert "a.md" not in [explorer._names[i] for i in explorer.filtered_indices], "Score of 40 should be filtered out"
+        
+        # Test empty search
+        explorer.handle_search("")
+        assert len(explorer.filtered_indices) == len(explorer._names), "Empty search should show all items"
     
     print("✓ Search functionality working")
 
@@ -195,6 +229,47 @@ def test_file_creation_simulation():
         
     print("✓ File creation simulation working")
 
+def test_note_creation():
+    """Test that new notes never overwrite existing files"""
+    print("Testing note creation...")
+    
+    explorer = FileExplorer()
+    opened = []
+    explorer.open_file = opened.append  # Don't launch an editor
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        explorer.current_path = tmp_path
+        (tmp_path / "test.md").write_text("existing")
+        (tmp_path / "test-1.md").write_text("existing")
+        
+        assert explorer.create_note("test"), "Note creation should succeed"
+        assert opened[-1] == tmp_path / "test-2.md", f"Expected next free name, got {opened[-1]}"
+        assert (tmp_path / "test.md").read_text() == "existing", "Existing note should be untouched"
+        
+        assert explorer.create_note("fresh note"), "Note creation should succeed"
+        assert opened[-1] == tmp_path / "fresh-note.md", "Unused names should be taken as is"
+        
+        # Names differing only in case count as taken
+        (tmp_path / "Draft.md").write_text("existing")
+        assert explorer.create_note("draft"), "Note creation should succeed"
+        assert opened[-1] == tmp_path / "draft-1.md", "Case-only collisions should get a suffix"
+        assert (tmp_path / "Draft.md").read_text() == "existing", "Existing note should be untouched"
+        
+        # Unreadable directories fall back to probing each name
+        import pow
+        saved = pow.os.listdir
+        def unreadable(path):
+            raise PermissionError(path)
+        pow.os.listdir = unreadable
+        try:
+            assert explorer.create_note("test"), "Note creation should work without a listing"
+        finally:
+            pow.os.listdir = saved
+        assert opened[-1] == tmp_path / "test-3.md", f"Expected next free name, got {opened[-1]}"
+    
+    print("✓ Note creation working")
+
 def test_text_extensions():
     """Test that TEXT_EXTENSIONS constant contains expected extensions"""
     print("Testing text extensions...")
@@ -217,21 +292,239 @@ def test_cursor_bounds():
     explorer = FileExplorer()
     
     # Test with empty items
-    explorer.items = []
+    explorer._names = []
     explorer.scan_directory()  # This should reset cursor
     assert explorer.cursor_position == 0, "Cursor should be 0 for empty list"
     
     # Test with items
-    explorer.items = [("test1.txt", False, Path("test1.txt"))]
+    explorer._names = ["test1.txt"]
     explorer.cursor_position = 5  # Out of bounds
     # Manually trigger cursor bounds check since scan_directory will rebuild items
-    if explorer.items:
-        explorer.cursor_position = min(explorer.cursor_position, len(explorer.items) - 1)
+    if explorer._names:
+        explorer.cursor_position = min(explorer.cursor_position, len(explorer._names) - 1)
         explorer.cursor_position = max(0, explorer.cursor_position)
     assert explorer.cursor_position == 0, "Cursor should be reset to valid position"
     
     print("✓ Cursor bounds working")
 
+def test_lazy_text_detection():
+    """Test that extensionless files are only sniffed when visible"""
+    print("Testing lazy text detection...")
+    
+    explorer = FileExplorer()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        explorer.current_path = tmp_path
+        for name in ("data1", "data2", "data3", "data4"):
+            (tmp_path / name).write_bytes(b'\x00\x01')
+        (tmp_path / "data5").write_text("text")
+        (tmp_path / "data6").write_text("text")
+        explorer.scan_directory()
+        
+        # Window of two rows: binaries are dropped until text fills it
+        explorer.resolve_visible(2)
+        assert explorer._names == ["../", "data5", "data6"], f"Unexpected items {explorer._names}"
+        assert explorer.cursor_position == 0, "Cursor should stay on its item"
+        
+        # Search results are remapped when items are dropped
+        explorer.scan_directory()
+        explorer.search_mode = True
+        explorer.handle_search("data")
+        assert len(explorer.filtered_indices) == 6, "Unchecked files should be searchable"
+        explorer.resolve_visible(10)
+        found = [explorer._names[i] for i in explorer.filtered_indices]
+        assert found == ["data5", "data6"], f"Search results should survive drops, got {found}"
+    
+        
+        # A binary just past the window is resolved so the tree ends correctly
+        (tmp_path / "a.md").write_text("")
+        (tmp_path / "b.md").write_text("")
+        (tmp_path / "data5").unlink()
+        (tmp_path / "data6").unlink()
+        explorer.scan_directory()
+        explorer.search_mode = False
+        explorer.resolve_visible(3)  # Shows ../, a.md, b.md
+        assert explorer._names == ["../", "a.md", "b.md"], f"Unexpected items {explorer._names}"
+        lines = explorer._compose_lines(7, 40)
+        assert lines[4] == "└── b.md", "Last text item should end the tree"
+        assert lines[6].startswith("[3 items]"), "Status should not count the dropped binaries"
+        (tmp_path / "data5").write_text("text")
+        (tmp_path / "data6").write_text("text")
+        
+        # Enter on a match that was never on screen must not open a binary
+        explorer.scan_directory()
+        opened = []
+        explorer.open_file = opened.append  # Don't launch an editor
+        explorer.search_mode = True
+        explorer.handle_search("data1")
+        target = explorer.filtered_indices[0]
+        assert explorer._names[target] == "data1", "Binary should match before it is sniffed"
+        explorer.open_item(target)
+        assert not opened, "Binary files should never be opened"
+        assert "data1" not in explorer._names, "Binary should be dropped when opened"
+        explorer.handle_search("data5")
+        explorer.open_item(explorer.filtered_indices[0])
+        assert opened == [tmp_path / "data5"], "Unchecked text files should still open"
+    
+    print("✓ Lazy text detection working")
+
+def test_frame_composition():
+    """Test that frames are composed as one string per screen row"""
+    print("Testing frame composition...")
+    
+    explorer = FileExplorer()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        explorer.current_path = tmp_path
+        (tmp_path / "a.txt").write_text("")
+        (tmp_path / "b.txt").write_text("")
+        explorer.scan_directory()
+        
+        lines = explorer._compose_lines(10, 40)
+        assert len(lines) == 10, "Frame should have one entry per row"
+        assert lines[0].endswith(str(tmp_path)[-30:]), "Header should show current path"
+        assert lines[2].endswith(" ◀"), "Cursor row should carry the indicator"
+        assert lines[4] == "└── b.txt", "Last item should use the end prefix"
+        assert lines[9].startswith("[3 items]"), "Status line should be on the last row"
+        assert all(len(line) <= 39 for line in lines), "Rows should fit the terminal width"
+        
+        # Very narrow terminals must not wrap file list rows either
+        for width in range(1, 8):
+            lines = explorer._compose_lines(10, width)
+            assert all(len(line) <= max(0, width - 1) for line in lines[2:5]), f"Rows should fit width {width}"
+    
+    print("✓ Frame composition working")
+
+class FakeScreen:
+    """Minimal stdscr stand-in that records drawing calls"""
+    
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.calls = []
+        self._row = 0
+    
+    def getmaxyx(self):
+        return self.height, self.width
+    
+    def clear(self):
+        self.calls.append(("clear",))
+    
+    def move(self, row, col):
+        self._row = row
+    
+    def clrtoeol(self):
+        self.calls.append(("clrtoeol", self._row))
+    
+    def addstr(self, row, col, text):
+        self.calls.append(("addstr", row, text))
+    
+    def refresh(self):
+        self.calls.append(("refresh",))
+
+def test_render_diff():
+    """Test that render_ui only repaints rows that changed"""
+    print("Testing render diffing...")
+    
+    import pow
+    explorer = FileExplorer()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        explorer.current_path = tmp_path
+        (tmp_path / "a.txt").write_text("")
+        (tmp_path / "b.txt").write_text("")
+        explorer.scan_directory()
+        screen = FakeScreen(10, 40)
+        
+        # First frame clears and paints every non-empty row
+        explorer.render_ui(screen)
+        assert screen.calls[0] == ("clear",), "First frame should clear the screen"
+        assert screen.calls[-1] == ("refresh",), "First frame should refresh"
+        painted = {call[1] for call in screen.calls if call[0] == "addstr"}
+        assert painted == {0, 2, 3, 4, 9}, f"Unexpected rows painted {painted}"
+        
+        # An identical frame touches nothing, not even refresh()
+        screen.calls = []
+        explorer.render_ui(screen)
+        assert screen.calls == [], "Unchanged frame should not draw"
+        
+        # Moving the cursor repaints just the two affected rows
+        explorer.cursor_position = 1
+        explorer.render_ui(screen)
+        assert screen.calls == [
+            ("clrtoeol", 2), ("addstr", 2, "├── ../"),
+            ("clrtoeol", 3), ("addstr", 3, "├── a.txt ◀"),
+            ("refresh",),
+        ], f"Unexpected calls {screen.calls}"
+        
+        # Rows that become empty are only wiped
+        screen.calls = []
+        (tmp_path / "b.txt").unlink()
+        explorer.scan_directory()
+        explorer.render_ui(screen)
+        assert ("clrtoeol", 4) in screen.calls, "Vanished row should be cleared"
+        assert not any(call[0] == "addstr" and call[1] == 4 for call in screen.calls), "Empty row should not be drawn"
+        
+        # A resize forces a full repaint
+        screen.calls = []
+        screen.width = 30
+        explorer.render_ui(screen)
+        assert screen.calls[0] == ("clear",), "Resize should clear the screen"
+        
+        # So does coming back from a failed editor launch
+        saved = pow.curses.endwin, pow.os.execvp, os.environ.get("EDITOR")
+        pow.curses.endwin = lambda: None
+        pow.os.execvp = lambda *args: None
+        os.environ["EDITOR"] = "true"
+        try:
+            explorer.open_file(tmp_path / "a.txt")
+        finally:
+            pow.curses.endwin, pow.os.execvp = saved[:2]
+            if saved[2] is None:
+                del os.environ["EDITOR"]
+            else:
+                os.environ["EDITOR"] = saved[2]
+        screen.calls = []
+        explorer.render_ui(screen)
+        assert screen.calls[0] == ("clear",), "Frame after the editor should clear the screen"
+    
+    print("✓ Render diffing working")
+
+def test_idle_ticks_skip_render():
+    """Test that getch timeouts don't trigger a re-render"""
+    print("Testing idle tick rendering...")
+    
+    import pow
+    explorer = FileExplorer()
+    renders = []
+    explorer.render_ui = renders.append
+    
+    class KeyScreen:
+        def __init__(self, keys):
+            self.keys = list(keys)
+        
+        def timeout(self, delay):
+            pass
+        
+        def getch(self):
+            return self.keys.pop(0)
+    
+    # Two timeouts, a cursor key, another timeout, then quit
+    screen = KeyScreen([-1, -1, pow.curses.KEY_DOWN, -1, ord('q')])
+    saved = pow.curses.curs_set
+    pow.curses.curs_set = lambda visibility: None
+    try:
+        explorer.main_loop(screen)
+    finally:
+        pow.curses.curs_set = saved
+    
+    assert len(renders) == 2, f"Expected initial render plus one per key, got {len(renders)}"
+    
+    print("✓ Idle tick rendering working")
+
 def run_all_tests():
     """Run all tests"""
     print("Running pow functionality tests...\n")
@@ -243,8 +536,13 @@ def run_all_tests():
         test_directory_scanning,
         test_search_functionality,
         test_file_creation_simulation,
+        test_note_creation,
         test_text_extensions,
         test_cursor_bounds,
+        test_lazy_text_detection,
+        test_frame_composition,
+        test_render_diff,
+        test_idle_ticks_skip_render,
     ]
     
     passed = 0